@@ -8,6 +8,7 @@ from trading_backtester.backtest import (
     BacktestEngine,
     Trade,
     run_backtest,
+    trades_from_frame,
     trades_to_frame,
 )
 
@@ -16,5 +17,6 @@ __all__ = [
     "BacktestEngine",
     "Trade",
     "run_backtest",
+    "trades_from_frame",
     "trades_to_frame",
 ]
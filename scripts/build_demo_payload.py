@@ -135,13 +135,13 @@ def _series_payload(dates: pd.Index, values: pd.Series) -> list[float | None]:
 def _trade_markers(trade_frame: pd.DataFrame, date_column: str, price_column: str):
     if trade_frame.empty:
         return []
-    frame = trade_frame.dropna(subset=[date_column, price_column]).copy()
+    frame = trade_frame[[date_column, price_column]].dropna()
     return [
         {
-            "date": str(row[date_column])[:10],
-            "price": _clean_number(row[price_column], digits=4),
+            "date": str(trade_date)[:10],
+            "price": _clean_number(price, digits=4),
         }
-        for _, row in frame.iterrows()
+        for trade_date, price in frame.itertuples(index=False, name=None)
     ]
 
 
@@ -156,19 +156,24 @@ def _recent_trades(trade_frame: pd.DataFrame) -> list[dict[str, Any]]:
         "return_pct",
         "exit_reason",
     ]
-    frame = trade_frame[columns].copy().tail(8).iloc[::-1]
+    frame = trade_frame[columns].tail(8).iloc[::-1]
     records: list[dict[str, Any]] = []
-    for _, row in frame.iterrows():
+    for (
+        entry_date,
+        exit_date,
+        side,
+        net_pnl,
+        return_pct,
+        exit_reason,
+    ) in frame.itertuples(index=False, name=None):
         records.append(
             {
-                "entry_date": str(row["entry_date"])[:10],
-                "exit_date": (
-                    str(row["exit_date"])[:10] if pd.notna(row["exit_date"]) else ""
-                ),
-                "side": str(row["side"]).title(),
-                "net_pnl": _clean_number(row["net_pnl"], digits=2),
-                "return_pct": _clean_number(row["return_pct"], digits=4),
-                "exit_reason": str(row["exit_reason"]).replace("_", " ").title(),
+                "entry_date": str(entry_date)[:10],
+                "exit_date": str(exit_date)[:10] if pd.notna(exit_date) else "",
+                "side": str(side).title(),
+                "net_pnl": _clean_number(net_pnl, digits=2),
+                "return_pct": _clean_number(return_pct, digits=4),
+                "exit_reason": str(exit_reason).replace("_", " ").title(),
             }
         )
     return records
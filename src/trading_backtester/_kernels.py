@@ -0,0 +1,360 @@
+"""Compiled inner loops for the backtest engine and strategies.
+
+Numba is an optional dependency (``pip install -e .[fast]``). When it is not
+installed the kernels below run as ordinary Python and produce the same
+trades, with equity matching to floating-point tolerance, just without the
+JIT speedup.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+
+EXIT_SIGNAL = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+EXIT_TRAILING_STOP = 3
+EXIT_END_OF_TEST = 4
+EXIT_REASONS = ("signal", "stop_loss", "take_profit", "trailing_stop", "end_of_test")
+
+# Row layout of the ledger returned by simulate_bars.
+LEDGER_CASH = 0
+LEDGER_SHARES = 1
+LEDGER_MARKET_VALUE = 2
+LEDGER_EQUITY = 3
+LEDGER_RETURNS = 4
+LEDGER_POSITION = 5
+LEDGER_TURNOVER = 6
+
+# Column layout of the integer and float trade tables.
+TRADE_ENTRY_BAR = 0
+TRADE_EXIT_BAR = 1
+TRADE_EXIT_REASON = 2
+TRADE_QUANTITY = 0
+TRADE_ENTRY_PRICE = 1
+TRADE_ENTRY_COSTS = 2
+TRADE_EXIT_PRICE = 3
+TRADE_EXIT_COSTS = 4
+
+
+@njit(cache=True)
+def _fill_price(
+    raw_price: float, direction: float, half_spread: float, slippage: float
+) -> float:
+    return raw_price * (1.0 + (direction * half_spread) + (direction * slippage))
+
+
+@njit(cache=True)
+def _commission(notional: float, commission_rate: float, fixed: float) -> float:
+    if notional <= 0.0:
+        return 0.0
+    return notional * commission_rate + fixed
+
+
+@njit(cache=True)
+def _close_position(
+    cash: float,
+    shares: float,
+    raw_price: float,
+    bar: int,
+    reason: int,
+    trade_int_row: np.ndarray,
+    trade_float_row: np.ndarray,
+    commission_rate: float,
+    fixed_commission: float,
+    half_spread: float,
+    slippage: float,
+) -> tuple[float, float]:
+    """Flatten ``shares`` at ``raw_price`` and record the exit on the trade row.
+
+    Returns the cash after the fill and costs, and the traded notional.
+    """
+    quantity = -shares
+    fill_price = _fill_price(raw_price, np.sign(quantity), half_spread, slippage)
+    notional = abs(quantity * fill_price)
+    costs = _commission(notional, commission_rate, fixed_commission)
+    cash -= quantity * fill_price
+    cash -= costs
+    trade_int_row[TRADE_EXIT_BAR] = bar
+    trade_int_row[TRADE_EXIT_REASON] = reason
+    trade_float_row[TRADE_EXIT_PRICE] = fill_price
+    trade_float_row[TRADE_EXIT_COSTS] = costs
+    return cash, notional
+
+
+@njit(cache=True)
+def simulate_bars(
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    target_signals: np.ndarray,
+    realized_vols: np.ndarray,
+    initial_capital: float,
+    position_size: float,
+    max_leverage: float,
+    commission_rate: float,
+    fixed_commission: float,
+    half_spread: float,
+    slippage: float,
+    volatility_target: float,
+    stop_loss: float,
+    take_profit: float,
+    trailing_stop: float,
+    close_on_finish: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Run the single-asset state machine over pre-shifted bar arrays.
+
+    ``target_signals`` and ``realized_vols`` must already be lagged by one bar
+    so that bar ``i`` acts on information from bar ``i - 1``. Disabled exits
+    and volatility targeting are passed as NaN and 0.0 respectively.
+
+    Returns the per-bar ledger (see the ``LEDGER_*`` rows), the integer and
+    float trade tables (``TRADE_*`` columns, one row per opened trade) and the
+    number of closed trades. A trade still open at the end occupies the row
+    at that count.
+    """
+    bar_count = len(closes)
+    ledger = np.empty((7, bar_count))
+    trade_ints = np.zeros((bar_count + 1, 3), dtype=np.int64)
+    trade_floats = np.zeros((bar_count + 1, 5))
+    trade_count = 0
+
+    cash = initial_capital
+    # The open trade's state lives in scalars; the trade table is only written
+    # on entry and exit, never read back inside the loop.
+    shares = 0.0
+    entry_price = 0.0
+    high_watermark = 0.0
+    low_watermark = 0.0
+    last_equity = initial_capital
+
+    signal_bars = np.flatnonzero(target_signals != 0.0)
+    index = 0
+    while index < bar_count:
+        target_signal = target_signals[index]
+        if shares == 0.0 and target_signal == 0.0:
+            # Flat with no signal: nothing can trade until the next signal bar,
+            # so fill the whole stretch at once. Bar 0 always lands here.
+            next_signal = np.searchsorted(signal_bars, index)
+            stop = (
+                signal_bars[next_signal]
+                if next_signal < len(signal_bars)
+                else bar_count
+            )
+            ledger[LEDGER_CASH, index:stop] = cash
+            ledger[LEDGER_SHARES, index:stop] = 0.0
+            ledger[LEDGER_MARKET_VALUE, index:stop] = 0.0
+            ledger[LEDGER_EQUITY, index:stop] = cash
+            ledger[LEDGER_RETURNS, index:stop] = 0.0
+            if index > 0:
+                ledger[LEDGER_RETURNS, index] = (cash / last_equity) - 1.0
+            ledger[LEDGER_POSITION, index:stop] = 0.0
+            ledger[LEDGER_TURNOVER, index:stop] = 0.0
+            last_equity = cash
+            index = stop
+            continue
+
+        open_price = opens[index]
+        turnover = 0.0
+
+        # Close on a flatten or a flip at today's open.
+        if shares != 0.0 and (
+            target_signal == 0.0 or (target_signal > 0.0) != (shares > 0.0)
+        ):
+            cash, notional = _close_position(
+                cash,
+                shares,
+                open_price,
+                index,
+                EXIT_SIGNAL,
+                trade_ints[trade_count],
+                trade_floats[trade_count],
+                commission_rate,
+                fixed_commission,
+                half_spread,
+                slippage,
+            )
+            shares = 0.0
+            trade_count += 1
+            turnover += notional
+
+        if shares == 0.0 and target_signal != 0.0:
+            direction = np.sign(target_signal)
+            fraction = position_size
+            realized_vol = realized_vols[index]
+            if volatility_target != 0.0 and realized_vol > 0.0:
+                fraction = min(fraction, volatility_target / realized_vol)
+            fraction = min(max(fraction, 0.0), max_leverage)
+            if fraction != 0.0:
+                quantity = (last_equity * fraction) / open_price
+                quantity *= direction
+                fill_price = _fill_price(
+                    open_price, np.sign(quantity), half_spread, slippage
+                )
+                notional = abs(quantity * fill_price)
+                costs = _commission(notional, commission_rate, fixed_commission)
+                cash -= quantity * fill_price
+                cash -= costs
+                shares += quantity
+                trade_ints[trade_count, TRADE_ENTRY_BAR] = index
+                trade_ints[trade_count, TRADE_EXIT_BAR] = -1
+                trade_floats[trade_count, TRADE_QUANTITY] = quantity
+                trade_floats[trade_count, TRADE_ENTRY_PRICE] = fill_price
+                trade_floats[trade_count, TRADE_ENTRY_COSTS] = costs
+                entry_price = fill_price
+                high_watermark = fill_price
+                low_watermark = fill_price
+                turnover += notional
+
+        if shares != 0.0:
+            # Intraday exits. When several levels are touched on the same bar
+            # the worst fill wins; ties keep the first level checked.
+            high_price = highs[index]
+            low_price = lows[index]
+            exit_reason = -1
+            exit_price = 0.0
+            if shares > 0.0:
+                high_watermark = max(high_watermark, high_price)
+                if stop_loss == stop_loss:
+                    level = entry_price * (1.0 - stop_loss)
+                    if low_price <= level:
+                        exit_reason = EXIT_STOP_LOSS
+                        exit_price = min(open_price, level)
+                if take_profit == take_profit:
+                    level = entry_price * (1.0 + take_profit)
+                    if high_price >= level:
+                        candidate = max(open_price, level)
+                        if exit_reason < 0 or candidate < exit_price:
+                            exit_reason = EXIT_TAKE_PROFIT
+                            exit_price = candidate
+                if trailing_stop == trailing_stop:
+                    level = high_watermark * (1.0 - trailing_stop)
+                    if low_price <= level:
+                        candidate = min(open_price, level)
+                        if exit_reason < 0 or candidate < exit_price:
+                            exit_reason = EXIT_TRAILING_STOP
+                            exit_price = candidate
+            else:
+                low_watermark = min(low_watermark, low_price)
+                if stop_loss == stop_loss:
+                    level = entry_price * (1.0 + stop_loss)
+                    if high_price >= level:
+                        exit_reason = EXIT_STOP_LOSS
+                        exit_price = max(open_price, level)
+                if take_profit == take_profit:
+                    level = entry_price * (1.0 - take_profit)
+                    if low_price <= level:
+                        candidate = min(open_price, level)
+                        if exit_reason < 0 or candidate > exit_price:
+                            exit_reason = EXIT_TAKE_PROFIT
+                            exit_price = candidate
+                if trailing_stop == trailing_stop:
+                    level = low_watermark * (1.0 + trailing_stop)
+                    if high_price >= level:
+                        candidate = max(open_price, level)
+                        if exit_reason < 0 or candidate > exit_price:
+                            exit_reason = EXIT_TRAILING_STOP
+                            exit_price = candidate
+
+            if exit_reason >= 0:
+                cash, notional = _close_position(
+                    cash,
+                    shares,
+                    exit_price,
+                    index,
+                    exit_reason,
+                    trade_ints[trade_count],
+                    trade_floats[trade_count],
+                    commission_rate,
+                    fixed_commission,
+                    half_spread,
+                    slippage,
+                )
+                shares = 0.0
+                trade_count += 1
+                turnover += notional
+
+        market_value = shares * closes[index]
+        equity = cash + market_value
+        ledger[LEDGER_CASH, index] = cash
+        ledger[LEDGER_SHARES, index] = shares
+        ledger[LEDGER_MARKET_VALUE, index] = market_value
+        ledger[LEDGER_EQUITY, index] = equity
+        ledger[LEDGER_RETURNS, index] = (equity / last_equity) - 1.0
+        ledger[LEDGER_POSITION, index] = market_value / equity if equity else 0.0
+        ledger[LEDGER_TURNOVER, index] = turnover / max(last_equity, 1.0)
+        last_equity = equity
+        index += 1
+
+    if close_on_finish and shares != 0.0:
+        last = bar_count - 1
+        cash, notional = _close_position(
+            cash,
+            shares,
+            closes[last],
+            last,
+            EXIT_END_OF_TEST,
+            trade_ints[trade_count],
+            trade_floats[trade_count],
+            commission_rate,
+            fixed_commission,
+            half_spread,
+            slippage,
+        )
+        shares = 0.0
+        trade_count += 1
+
+        prior_value = ledger[LEDGER_EQUITY, last - 1] if last > 0 else initial_capital
+        ledger[LEDGER_CASH, last] = cash
+        ledger[LEDGER_SHARES, last] = 0.0
+        ledger[LEDGER_MARKET_VALUE, last] = 0.0
+        ledger[LEDGER_EQUITY, last] = cash
+        ledger[LEDGER_POSITION, last] = 0.0
+        ledger[LEDGER_TURNOVER, last] += notional / max(prior_value, 1.0)
+        ledger[LEDGER_RETURNS, last] = (cash / prior_value) - 1.0 if last > 0 else 0.0
+
+    return ledger, trade_ints, trade_floats, trade_count
+
+
+@njit(cache=True)
+def mean_reversion_positions(
+    liquid: np.ndarray,
+    zscores: np.ndarray,
+    entry_zscore: float,
+    exit_zscore: float,
+    allow_short: bool,
+) -> np.ndarray:
+    """Bar-by-bar z-score entry/exit state machine; returns -1/0/1 positions.
+
+    Illiquid bars force a flat position. ``zscores`` must not contain NaN.
+    """
+    positions = np.zeros(len(zscores), dtype=np.int8)
+    current_position = 0
+    for index in range(len(zscores)):
+        current_zscore = zscores[index]
+        if not liquid[index]:
+            current_position = 0
+        elif current_position == 0:
+            if current_zscore <= -entry_zscore:
+                current_position = 1
+            elif allow_short and current_zscore >= entry_zscore:
+                current_position = -1
+        elif current_position > 0 and current_zscore >= -exit_zscore:
+            current_position = 0
+        elif current_position < 0 and current_zscore <= exit_zscore:
+            current_position = 0
+        positions[index] = current_position
+    return positions
@@ -61,6 +61,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "test_bars": 63,
         "step_bars": 63,
         "metric": "Sharpe Ratio",
+        "n_jobs": 1,
         "parameter_grid": {
             "mean_reversion": {
                 "lookback": [10, 20, 30],
@@ -5,6 +5,15 @@ from pathlib import Path
 import pandas as pd
 import yfinance as yf
 
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    _HAS_PYARROW = False
+else:
+    _HAS_PYARROW = True
+
+_CSV_ENGINE = "pyarrow" if _HAS_PYARROW else "c"
+
 REQUIRED_PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
 
 
@@ -17,6 +26,52 @@ def _normalize_columns(data: pd.DataFrame) -> pd.DataFrame:
     return data
 
 
+def _datetime_index(values: pd.Series) -> pd.DatetimeIndex:
+    """Parse CSV timestamps the same way whichever engine produced them.
+
+    pyarrow already converts offset-aware stamps to UTC, while the C engine
+    leaves them as strings that pandas cannot combine once the offset
+    changes (DST). Offset-aware stamps therefore always become UTC; naive
+    ones stay naive. The resolution is nanoseconds on both engines.
+    """
+    first = values.dropna().iloc[:1]
+    aware = isinstance(values.dtype, pd.DatetimeTZDtype) or (
+        not first.empty and pd.Timestamp(first.iloc[0]).tzinfo is not None
+    )
+    return pd.DatetimeIndex(pd.to_datetime(values, utc=aware)).as_unit("ns")
+
+
+def read_timeseries_csv(
+    path: str | Path, *, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """Read a CSV whose first column holds the dates, as a DatetimeIndex frame.
+
+    When ``columns`` is given only those columns are parsed. The multithreaded
+    pyarrow parser is used when pyarrow is installed. Timestamps with a UTC
+    offset, such as intraday caches, are returned in UTC.
+    """
+    usecols = None
+    if columns is not None and isinstance(path, str | Path):
+        # Peek at the header with pandas so compression, BOMs and URLs are
+        # handled as in the full read (the pyarrow engine cannot stop after
+        # the header). Buffers can only be read once and are parsed whole.
+        header = pd.read_csv(path, nrows=0, index_col=0)
+        if header.index.name is not None:
+            usecols = [
+                header.index.name,
+                *[name for name in header.columns if name in columns],
+            ]
+    frame = pd.read_csv(path, engine=_CSV_ENGINE, usecols=usecols)
+    index_name = str(frame.columns[0])
+    frame.index = _datetime_index(frame.pop(frame.columns[0]))
+    # An empty header cell comes back as "" or "Unnamed: 0" depending on the
+    # engine; index_col=0 reads either as an unnamed index.
+    frame.index.name = (
+        index_name if index_name and not index_name.startswith("Unnamed:") else None
+    )
+    return frame
+
+
 def validate_price_data(data: pd.DataFrame) -> pd.DataFrame:
     normalized = _normalize_columns(data)
     missing = [
@@ -39,13 +94,23 @@ def fetch_price_data(
     cache_dir: str | Path = "data/raw",
     refresh: bool = False,
 ) -> pd.DataFrame:
+    """Download price bars for ``symbol``, reusing the on-disk cache if present.
+
+    With pyarrow installed the cache is written as Parquet; CSV caches from
+    earlier runs (or from installs without pyarrow) are still read.
+    """
     cache_path = Path(cache_dir)
     cache_path.mkdir(parents=True, exist_ok=True)
-    file_path = cache_path / f"{symbol}_{interval}.csv"
+    parquet_path = cache_path / f"{symbol}_{interval}.parquet"
+    csv_path = cache_path / f"{symbol}_{interval}.csv"
 
-    if file_path.exists() and not refresh:
-        data = pd.read_csv(file_path, index_col=0, parse_dates=True)
-        return validate_price_data(data)
+    if not refresh:
+        if _HAS_PYARROW and parquet_path.exists():
+            data = pd.read_parquet(parquet_path, columns=REQUIRED_PRICE_COLUMNS)
+            return validate_price_data(data)
+        if csv_path.exists():
+            data = read_timeseries_csv(csv_path, columns=REQUIRED_PRICE_COLUMNS)
+            return validate_price_data(data)
 
     data = yf.download(
         symbol,
@@ -56,9 +121,14 @@ def fetch_price_data(
         progress=False,
     )
     validated = validate_price_data(data)
-    validated.to_csv(file_path)
+    if _HAS_PYARROW:
+        validated.to_parquet(parquet_path)
+    else:
+        validated.to_csv(csv_path)
     return validated
 
 
 def load_price_data(path: str | Path) -> pd.DataFrame:
-    return validate_price_data(pd.read_csv(path, index_col=0, parse_dates=True))
+    return validate_price_data(
+        read_timeseries_csv(path, columns=REQUIRED_PRICE_COLUMNS)
+    )
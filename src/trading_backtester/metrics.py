@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 
 import numpy as np
 import pandas as pd
@@ -9,23 +10,80 @@ import pandas as pd
 from .backtest import Trade
 
 
-@dataclass
+@dataclass(frozen=True)
+class _ReturnSummary:
+    """Scalar reductions shared by several PerformanceMetrics methods."""
+
+    total_return: float
+    volatility: float
+    excess_mean: float
+    excess_volatility: float
+    downside_deviation: float
+    max_drawdown: float
+
+
+@dataclass(frozen=True)
 class PerformanceMetrics:
     returns: pd.Series
     risk_free_rate: float = 0.02
     annual_factor: int = 252
+    _sqrt_af: float = field(init=False, repr=False, compare=False)
+    _rf_daily: float = field(init=False, repr=False, compare=False)
+    _values: np.ndarray = field(init=False, repr=False, compare=False)
+    _excess: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         cleaned = pd.to_numeric(self.returns, errors="coerce").fillna(0.0)
         if cleaned.empty:
             raise ValueError("returns series is empty")
-        self.returns = cleaned
+        # Frozen, so the derived buffers (and the cached _summary) can never
+        # go stale behind a reassigned input.
+        rf_daily = self.risk_free_rate / self.annual_factor
+        # Every metric reads these shared buffers rather than re-deriving
+        # arrays or masks from the Series.
+        values = cleaned.to_numpy(dtype=np.float64)
+        object.__setattr__(self, "returns", cleaned)
+        object.__setattr__(self, "_sqrt_af", float(np.sqrt(self.annual_factor)))
+        object.__setattr__(self, "_rf_daily", rf_daily)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_excess", values - rf_daily)
+
+    @cached_property
+    def _summary(self) -> _ReturnSummary:
+        # Computed once per instance so a full metrics report walks the return
+        # array a handful of times instead of once per method.
+        returns = self._values
+        excess_returns = self._excess
+        downside = excess_returns[excess_returns < 0.0]
+        equity_curve = np.cumprod(1.0 + returns)
+        rolling_peak = np.maximum.accumulate(equity_curve)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = np.where(
+                rolling_peak > 0.0, (equity_curve / rolling_peak) - 1.0, 0.0
+            )
+        # Summing log growth is more stable than a long running product, but
+        # log1p is undefined once a bar loses 100% or more.
+        total_return = (
+            np.expm1(np.log1p(returns).sum())
+            if (returns > -1.0).all()
+            else equity_curve[-1] - 1.0
+        )
+        return _ReturnSummary(
+            total_return=float(total_return),
+            volatility=float(returns.std()),
+            excess_mean=float(excess_returns.mean()),
+            excess_volatility=float(excess_returns.std()),
+            downside_deviation=(
+                float(np.sqrt(np.mean(downside**2))) if downside.size else 0.0
+            ),
+            max_drawdown=float(drawdown.min()),
+        )
 
     def total_return(self) -> float:
-        return float((1.0 + self.returns).prod() - 1.0)
+        return self._summary.total_return
 
     def annualized_return(self) -> float:
-        periods = len(self.returns)
+        periods = len(self._values)
         if periods == 0:
             return float("nan")
         compounded = 1.0 + self.total_return()
@@ -35,32 +93,22 @@ class PerformanceMetrics:
         return float(compounded ** (1.0 / years) - 1.0)
 
     def annualized_volatility(self) -> float:
-        return float(self.returns.std(ddof=0) * np.sqrt(self.annual_factor))
+        return float(self._summary.volatility * self._sqrt_af)
 
     def sharpe_ratio(self) -> float:
-        excess_returns = self.returns - (self.risk_free_rate / self.annual_factor)
-        volatility = excess_returns.std(ddof=0)
-        if volatility == 0.0:
+        summary = self._summary
+        if summary.excess_volatility == 0.0:
             return float("nan")
-        return float(np.sqrt(self.annual_factor) * excess_returns.mean() / volatility)
+        return float(self._sqrt_af * summary.excess_mean / summary.excess_volatility)
 
     def sortino_ratio(self) -> float:
-        excess_returns = self.returns - (self.risk_free_rate / self.annual_factor)
-        downside = excess_returns[excess_returns < 0.0]
-        downside_deviation = (
-            np.sqrt((downside**2).mean()) if not downside.empty else 0.0
-        )
-        if downside_deviation == 0.0:
+        summary = self._summary
+        if summary.downside_deviation == 0.0:
             return float("inf")
-        return float(
-            np.sqrt(self.annual_factor) * excess_returns.mean() / downside_deviation
-        )
+        return float(self._sqrt_af * summary.excess_mean / summary.downside_deviation)
 
     def max_drawdown(self) -> float:
-        equity_curve = (1.0 + self.returns).cumprod()
-        rolling_peak = equity_curve.cummax()
-        drawdown = (equity_curve / rolling_peak) - 1.0
-        return float(drawdown.min())
+        return self._summary.max_drawdown
 
     def calmar_ratio(self) -> float:
         drawdown = self.max_drawdown()
@@ -75,7 +123,7 @@ class PerformanceMetrics:
         `confidence` fraction of days. E.g. a 95% VaR of -0.02 means
         losses exceed 2% on only 5% of trading days.
         """
-        return float(np.percentile(self.returns, (1.0 - confidence) * 100))
+        return float(np.percentile(self._values, (1.0 - confidence) * 100))
 
     def expected_shortfall(self, confidence: float = 0.95) -> float:
         """Expected Shortfall (CVaR) — average loss in the tail beyond VaR.
@@ -83,14 +131,22 @@ class PerformanceMetrics:
         More informative than VaR for fat-tailed return distributions because
         it captures the severity of tail losses, not just the frequency.
         """
-        cutoff = np.percentile(self.returns, (1.0 - confidence) * 100)
-        tail = self.returns[self.returns <= cutoff]
-        return float(tail.mean()) if len(tail) > 0 else cutoff
+        cutoff = np.percentile(self._values, (1.0 - confidence) * 100)
+        tail = self._values[self._values <= cutoff]
+        return float(tail.mean()) if tail.size > 0 else float(cutoff)
 
 
-def _trade_metrics(trades: Iterable[Trade]) -> dict[str, float]:
-    trade_list = list(trades)
-    if not trade_list:
+def _trade_metrics(trades: Iterable[Trade] | pd.DataFrame) -> dict[str, float]:
+    if isinstance(trades, pd.DataFrame):
+        net_pnls = trades["net_pnl"].to_numpy(dtype=float)
+        returns = trades["return_pct"].to_numpy(dtype=float)
+    else:
+        # One pass over the trades collects both attributes.
+        values = np.array(
+            [(trade.net_pnl, trade.return_pct) for trade in trades], dtype=float
+        ).reshape(-1, 2)
+        net_pnls, returns = values[:, 0], values[:, 1]
+    if not net_pnls.size:
         return {
             "Win Rate": float("nan"),
             "Profit Factor": float("nan"),
@@ -98,14 +154,12 @@ def _trade_metrics(trades: Iterable[Trade]) -> dict[str, float]:
             "Total Trades": 0.0,
         }
 
-    net_pnls = np.array([trade.net_pnl for trade in trade_list], dtype=float)
-    returns = np.array([trade.return_pct for trade in trade_list], dtype=float)
     gross_profit = net_pnls[net_pnls > 0.0].sum()
     gross_loss = abs(net_pnls[net_pnls < 0.0].sum())
     profit_factor = gross_profit / gross_loss if gross_loss > 0.0 else float("inf")
 
     winning = net_pnls[net_pnls > 0.0]
-    losing  = net_pnls[net_pnls < 0.0]
+    losing = net_pnls[net_pnls < 0.0]
 
     return {
         "Win Rate": float((net_pnls > 0.0).mean()),
@@ -113,10 +167,24 @@ def _trade_metrics(trades: Iterable[Trade]) -> dict[str, float]:
         "Average Trade Return": float(np.nanmean(returns)),
         "Average Win": float(winning.mean()) if winning.size > 0 else float("nan"),
         "Average Loss": float(losing.mean()) if losing.size > 0 else float("nan"),
-        "Total Trades": float(len(trade_list)),
+        "Total Trades": float(net_pnls.size),
     }
 
 
+# Keys of _benchmark_metrics, in report order. They only exist when
+# calculate_metrics is given benchmark returns.
+_BENCHMARK_METRIC_KEYS = (
+    "Benchmark Return",
+    "Benchmark Annualized Return",
+    "Excess Return",
+    "Tracking Error",
+    "Information Ratio",
+    "Beta",
+    "Alpha",
+)
+BENCHMARK_METRIC_NAMES = frozenset(_BENCHMARK_METRIC_KEYS)
+
+
 def _benchmark_metrics(
     returns: pd.Series,
     benchmark_returns: pd.Series,
@@ -136,11 +204,13 @@ def _benchmark_metrics(
         risk_free_rate=risk_free_rate,
         annual_factor=annual_factor,
     )
-    active_returns = strategy_returns - benchmark
-    tracking_error = active_returns.std(ddof=0) * np.sqrt(annual_factor)
+    sqrt_af = float(np.sqrt(annual_factor))
+    active_returns = (strategy_returns - benchmark).to_numpy(dtype=float)
+    active_volatility = active_returns.std()
+    tracking_error = active_volatility * sqrt_af
     information_ratio = (
-        np.sqrt(annual_factor) * active_returns.mean() / active_returns.std(ddof=0)
-        if active_returns.std(ddof=0) > 0.0
+        sqrt_af * active_returns.mean() / active_volatility
+        if active_volatility > 0.0
         else float("nan")
     )
 
@@ -156,25 +226,29 @@ def _benchmark_metrics(
         * annual_factor
     )
 
-    return {
-        "Benchmark Return": benchmark_stats.total_return(),
-        "Benchmark Annualized Return": benchmark_stats.annualized_return(),
-        "Excess Return": PerformanceMetrics(
+    excess_return = (
+        PerformanceMetrics(
             returns=strategy_returns,
             risk_free_rate=risk_free_rate,
             annual_factor=annual_factor,
         ).total_return()
-        - benchmark_stats.total_return(),
-        "Tracking Error": float(tracking_error),
-        "Information Ratio": float(information_ratio),
-        "Beta": float(beta),
-        "Alpha": alpha,
-    }
+        - benchmark_stats.total_return()
+    )
+    values = (
+        benchmark_stats.total_return(),
+        benchmark_stats.annualized_return(),
+        excess_return,
+        float(tracking_error),
+        float(information_ratio),
+        float(beta),
+        alpha,
+    )
+    return dict(zip(_BENCHMARK_METRIC_KEYS, values, strict=True))
 
 
 def calculate_metrics(
     data: pd.Series | pd.DataFrame,
-    trades: Iterable[Trade] | None = None,
+    trades: Iterable[Trade] | pd.DataFrame | None = None,
     *,
     risk_free_rate: float = 0.02,
     benchmark_returns: pd.Series | None = None,
@@ -224,5 +298,5 @@ def calculate_metrics(
                 annual_factor=stats.annual_factor,
             )
         )
-    metrics.update(_trade_metrics(trades or []))
+    metrics.update(_trade_metrics(trades if trades is not None else []))
     return metrics
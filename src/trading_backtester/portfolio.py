@@ -1,53 +1,37 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
-def buy_and_hold_curve(close: pd.Series, initial_capital: float) -> pd.Series:
-    returns = pd.to_numeric(close, errors="coerce").pct_change().fillna(0.0)
-    return initial_capital * (1.0 + returns).cumprod()
+def simple_returns(prices: np.ndarray) -> np.ndarray:
+    """Bar-over-bar returns of a price array; the first element is NaN.
 
+    Same arithmetic as ``Series.pct_change`` on gap-free input, computed
+    directly on the ndarray.
+    """
+    returns = np.empty(len(prices))
+    returns[:1] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(prices[1:], prices[:-1], out=returns[1:])
+    returns[1:] -= 1.0
+    return returns
 
-def combine_results(
-    results_by_symbol: dict[str, pd.DataFrame], initial_capital: float
-) -> pd.DataFrame:
-    """Combine per-symbol result frames into an equal-weighted portfolio.
-    Returns are averaged across symbols; portfolio value compounds from there."""
-    if not results_by_symbol:
-        raise ValueError("results_by_symbol cannot be empty")
 
-    combined_returns = (
-        pd.concat(
-            [
-                frame["Returns"].rename(symbol)
-                for symbol, frame in results_by_symbol.items()
-            ],
-            axis=1,
-        )
-        .fillna(0.0)
-        .mean(axis=1)
-    )
-    combined = pd.DataFrame(index=combined_returns.index)
-    combined["Returns"] = combined_returns
-    combined["Portfolio_Value"] = initial_capital * (1.0 + combined_returns).cumprod()
-    combined["Cash"] = combined["Portfolio_Value"]
-    combined["Shares"] = 0.0
-    combined["Market_Value"] = 0.0
-    combined["Gross_Exposure"] = (
-        pd.concat(
-            [
-                frame["Gross_Exposure"].rename(symbol)
-                for symbol, frame in results_by_symbol.items()
-            ],
-            axis=1,
-        )
-        .fillna(0.0)
-        .mean(axis=1)
+def buy_and_hold_curve(close: pd.Series, initial_capital: float) -> pd.Series:
+    prices = pd.to_numeric(close, errors="coerce").ffill().to_numpy(dtype=float)
+    returns = simple_returns(prices)
+    returns[np.isnan(returns)] = 0.0
+    return pd.Series(
+        initial_capital * np.cumprod(1.0 + returns), index=close.index, name=close.name
     )
-    combined["Net_Exposure"] = (
+
+
+def _equal_weight(results_by_symbol: dict[str, pd.DataFrame], column: str) -> pd.Series:
+    return (
         pd.concat(
             [
-                frame["Net_Exposure"].rename(symbol)
+                frame[column].rename(symbol)
                 for symbol, frame in results_by_symbol.items()
             ],
             axis=1,
@@ -55,21 +39,34 @@ def combine_results(
         .fillna(0.0)
         .mean(axis=1)
     )
-    combined["Position"] = combined["Net_Exposure"] / combined[
-        "Portfolio_Value"
-    ].replace(0.0, pd.NA)
-    combined["Turnover"] = (
-        pd.concat(
-            [
-                frame["Turnover"].rename(symbol)
-                for symbol, frame in results_by_symbol.items()
-            ],
-            axis=1,
-        )
-        .fillna(0.0)
-        .mean(axis=1)
+
+
+def combine_results(
+    results_by_symbol: dict[str, pd.DataFrame], initial_capital: float
+) -> pd.DataFrame:
+    """Combine per-symbol result frames into an equal-weighted portfolio.
+    Returns are averaged across symbols; portfolio value compounds from there."""
+    if not results_by_symbol:
+        raise ValueError("results_by_symbol cannot be empty")
+
+    combined_returns = _equal_weight(results_by_symbol, "Returns")
+    portfolio_value = initial_capital * (1.0 + combined_returns).cumprod()
+    net_exposure = _equal_weight(results_by_symbol, "Net_Exposure")
+    combined = pd.DataFrame(
+        {
+            "Returns": combined_returns,
+            "Portfolio_Value": portfolio_value,
+            "Cash": portfolio_value,
+            "Shares": 0.0,
+            "Market_Value": 0.0,
+            "Gross_Exposure": _equal_weight(results_by_symbol, "Gross_Exposure"),
+            "Net_Exposure": net_exposure,
+            "Position": net_exposure / portfolio_value.replace(0.0, pd.NA),
+            "Turnover": _equal_weight(results_by_symbol, "Turnover"),
+            "Signal": 0.0,
+        },
+        index=combined_returns.index,
     )
-    combined["Signal"] = 0.0
     return combined.fillna(0.0)
 
 
@@ -81,17 +78,24 @@ def rebuild_results_from_ratios(
     turnover: pd.Series,
     initial_capital: float,
 ) -> pd.DataFrame:
-    frame = pd.DataFrame(index=returns.index)
-    frame["Returns"] = returns.fillna(0.0)
-    frame["Portfolio_Value"] = initial_capital * (1.0 + frame["Returns"]).cumprod()
-    gross_ratio = gross_exposure_ratio.reindex(frame.index).fillna(0.0)
-    net_ratio = net_exposure_ratio.reindex(frame.index).fillna(0.0)
-    frame["Gross_Exposure"] = gross_ratio * frame["Portfolio_Value"]
-    frame["Net_Exposure"] = net_ratio * frame["Portfolio_Value"]
-    frame["Market_Value"] = frame["Net_Exposure"]
-    frame["Cash"] = frame["Portfolio_Value"] - frame["Market_Value"]
-    frame["Shares"] = 0.0
-    frame["Position"] = net_ratio
-    frame["Turnover"] = turnover.reindex(frame.index).fillna(0.0)
-    frame["Signal"] = 0.0
+    filled_returns = returns.fillna(0.0)
+    portfolio_value = initial_capital * (1.0 + filled_returns).cumprod()
+    gross_ratio = gross_exposure_ratio.reindex(returns.index).fillna(0.0)
+    net_ratio = net_exposure_ratio.reindex(returns.index).fillna(0.0)
+    net_exposure = net_ratio * portfolio_value
+    frame = pd.DataFrame(
+        {
+            "Returns": filled_returns,
+            "Portfolio_Value": portfolio_value,
+            "Gross_Exposure": gross_ratio * portfolio_value,
+            "Net_Exposure": net_exposure,
+            "Market_Value": net_exposure,
+            "Cash": portfolio_value - net_exposure,
+            "Shares": 0.0,
+            "Position": net_ratio,
+            "Turnover": turnover.reindex(returns.index).fillna(0.0),
+            "Signal": 0.0,
+        },
+        index=returns.index,
+    )
     return frame.fillna(0.0)
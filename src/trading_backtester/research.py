@@ -1,21 +1,32 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import partial
 from itertools import product
 from json import dumps
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from .backtest import BacktestConfig, BacktestEngine, Trade
+from .backtest import BacktestConfig, BacktestEngine, trades_from_frame
 from .config import deep_merge
 from .data import fetch_price_data
-from .metrics import calculate_metrics
-from .portfolio import buy_and_hold_curve, combine_results, rebuild_results_from_ratios
+from .metrics import BENCHMARK_METRIC_NAMES, calculate_metrics
+from .portfolio import (
+    buy_and_hold_curve,
+    combine_results,
+    rebuild_results_from_ratios,
+    simple_returns,
+)
 from .reporting import write_run_artifacts
-from .strategies import build_strategy
+from .strategies import STRATEGY_TYPES, build_strategy
 
 
 @dataclass(frozen=True)
@@ -34,6 +45,7 @@ class WalkForwardConfig:
     test_bars: int = 63
     step_bars: int = 63
     metric: str = "Sharpe Ratio"
+    n_jobs: int = 1
 
     @classmethod
     def from_dict(cls, config: dict[str, Any]) -> WalkForwardConfig:
@@ -42,6 +54,7 @@ class WalkForwardConfig:
             test_bars=int(config.get("test_bars", 63)),
             step_bars=int(config.get("step_bars", config.get("test_bars", 63))),
             metric=str(config.get("metric", "Sharpe Ratio")),
+            n_jobs=int(config.get("n_jobs", 1)),
         )
 
 
@@ -117,6 +130,21 @@ def _strategy_config_with_params(
     return merged
 
 
+def _is_valid_candidate(
+    strategy_config: dict[str, Any],
+    strategy_name: str,
+    params: dict[str, Any],
+) -> bool:
+    """Whether the strategy accepts ``params``, e.g. short_window < long_window."""
+    try:
+        build_strategy(
+            _strategy_config_with_params(strategy_config, strategy_name, params)
+        )
+    except ValueError:
+        return False
+    return True
+
+
 def _run_symbol_backtest(
     *,
     data: pd.DataFrame,
@@ -124,17 +152,27 @@ def _run_symbol_backtest(
     backtest_config: BacktestConfig,
     symbol: str,
     live_start: pd.Timestamp | None = None,
-) -> tuple[pd.DataFrame, list[Trade]]:
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     strategy = build_strategy(strategy_config)
     signals = strategy.generate_signals(data)
     if live_start is not None:
-        warmup_mask = signals.index < live_start
-        if warmup_mask.any():
-            signals.loc[warmup_mask, "target_position"] = 0.0
+        # Signals share the sorted price index, so the warm-up bars are a
+        # positional prefix: no boolean mask or label alignment needed.
+        warmup_bars = int(signals.index.searchsorted(live_start))
+        if warmup_bars:
+            signals.iloc[:warmup_bars, signals.columns.get_loc("target_position")] = 0
             if "signal" in signals.columns:
-                signals.loc[warmup_mask, "signal"] = 0.0
+                signals.iloc[:warmup_bars, signals.columns.get_loc("signal")] = 0
     engine = BacktestEngine(backtest_config)
-    return engine.run(data, signals, symbol=symbol)
+    return engine.simulate(data, signals, symbol=symbol)
+
+
+def _concat_trade_frames(trade_frames: list[pd.DataFrame]) -> pd.DataFrame:
+    # Empty frames are skipped; pandas deprecates concatenating them.
+    non_empty = [frame for frame in trade_frames if not frame.empty]
+    if not non_empty:
+        return trade_frames[0].iloc[:0]
+    return pd.concat(non_empty, ignore_index=True)
 
 
 def _evaluate_window(
@@ -147,14 +185,15 @@ def _evaluate_window(
     end: pd.Timestamp,
     benchmark_returns: pd.Series | None = None,
     warmup_start: pd.Timestamp | None = None,
-) -> tuple[pd.DataFrame, dict[str, float], list[Trade]]:
+) -> tuple[pd.DataFrame, dict[str, float], pd.DataFrame]:
+    """Backtest one window; trades come back as a columnar trade frame."""
     results_by_symbol: dict[str, pd.DataFrame] = {}
-    all_trades: list[Trade] = []
+    trade_frames: list[pd.DataFrame] = []
 
     for symbol, full_data in price_data_by_symbol.items():
         window_start = warmup_start if warmup_start is not None else start
         window_data = full_data.loc[window_start:end]
-        results, trades = _run_symbol_backtest(
+        results, trade_frame = _run_symbol_backtest(
             data=window_data,
             strategy_config=strategy_config,
             backtest_config=backtest_config,
@@ -163,13 +202,8 @@ def _evaluate_window(
         )
         live_results = results.loc[start:end]
         results_by_symbol[symbol] = live_results
-        all_trades.extend(
-            [
-                trade
-                for trade in trades
-                if trade.entry_date >= start and trade.entry_date <= end
-            ]
-        )
+        entry_dates = trade_frame["entry_date"]
+        trade_frames.append(trade_frame[(entry_dates >= start) & (entry_dates <= end)])
 
     combined = combine_results(
         results_by_symbol=results_by_symbol,
@@ -178,6 +212,7 @@ def _evaluate_window(
     benchmark_slice = (
         benchmark_returns.loc[start:end] if benchmark_returns is not None else None
     )
+    all_trades = _concat_trade_frames(trade_frames)
     metrics = calculate_metrics(
         combined,
         all_trades,
@@ -187,6 +222,116 @@ def _evaluate_window(
     return combined, metrics, all_trades
 
 
+def _score_candidate(
+    strategy_config: dict[str, Any],
+    *,
+    price_data_by_symbol: dict[str, pd.DataFrame],
+    backtest_config: BacktestConfig,
+    risk_free_rate: float,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    benchmark_returns: pd.Series | None,
+    metric: str,
+) -> float:
+    # Benchmark analytics are the costliest part of the metrics report; only
+    # compute them when the selection metric is one of them.
+    _, metrics, _ = _evaluate_window(
+        price_data_by_symbol=price_data_by_symbol,
+        strategy_config=strategy_config,
+        backtest_config=backtest_config,
+        risk_free_rate=risk_free_rate,
+        start=start,
+        end=end,
+        benchmark_returns=(
+            benchmark_returns if metric in BENCHMARK_METRIC_NAMES else None
+        ),
+    )
+    return float(metrics.get(metric, float("-inf")))
+
+
+# Inputs that stay fixed for a whole walk-forward run. Worker processes
+# receive them once through the pool initializer instead of with every task.
+_WORKER_INPUTS: dict[str, Any] = {}
+
+
+def _init_candidate_worker(inputs: dict[str, Any]) -> None:
+    _WORKER_INPUTS.update(inputs)
+
+
+def _score_candidate_in_worker(
+    strategy_config: dict[str, Any],
+    *,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    metric: str,
+) -> float:
+    return _score_candidate(
+        strategy_config, start=start, end=end, metric=metric, **_WORKER_INPUTS
+    )
+
+
+def _score_candidates(
+    strategy_configs: list[dict[str, Any]],
+    *,
+    executor: Executor | None,
+    workers: int = 1,
+    inputs: dict[str, Any],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    metric: str,
+) -> list[float]:
+    """Score every candidate on one training window, in candidate order.
+
+    ``inputs`` holds the run-wide keyword arguments of ``_score_candidate``;
+    a pool made by ``_candidate_executor`` must have been given the same.
+    ``workers`` is that pool's size and only sets the batch size.
+    """
+    if executor is None:
+        return [
+            _score_candidate(
+                strategy_config, start=start, end=end, metric=metric, **inputs
+            )
+            for strategy_config in strategy_configs
+        ]
+    score = partial(_score_candidate_in_worker, start=start, end=end, metric=metric)
+    # Hand each worker a few batches rather than one candidate per task so
+    # pickling and dispatch overhead is paid per batch.
+    chunksize = max(1, len(strategy_configs) // (max(workers, 1) * 4))
+    return list(executor.map(score, strategy_configs, chunksize=chunksize))
+
+
+def _candidate_workers(n_jobs: int) -> int:
+    """Worker processes for ``n_jobs``: 1 is serial, -1 every available core."""
+    return (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+
+
+@contextmanager
+def _candidate_executor(
+    n_jobs: int, inputs: dict[str, Any]
+) -> Iterator[Executor | None]:
+    """Process pool for candidate scoring; None runs serially in-process.
+
+    The pool has ``_candidate_workers(n_jobs)`` processes. Each worker loads
+    ``inputs`` once at startup.
+    """
+    workers = _candidate_workers(n_jobs)
+    if workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_candidate_worker,
+        initargs=(inputs,),
+    ) as executor:
+        yield executor
+
+
+def _curve_returns(curve: pd.Series) -> pd.Series:
+    returns = simple_returns(curve.to_numpy(dtype=float))
+    returns[np.isnan(returns)] = 0.0
+    return pd.Series(returns, index=curve.index)
+
+
 def _window_feature_frame(results: pd.DataFrame) -> pd.DataFrame:
     feature_frame = pd.DataFrame(index=results.index)
     portfolio_value = results["Portfolio_Value"].replace(0.0, pd.NA)
@@ -222,8 +367,15 @@ def run_walk_forward_from_config(
 ) -> tuple[pd.DataFrame, dict[str, float], Path]:
     research_config = WalkForwardConfig.from_dict(config.get("research", {}))
     strategy_name = config["strategy"]["name"]
+    if strategy_name not in STRATEGY_TYPES:
+        raise ValueError(f"Unknown strategy: {strategy_name}")
     parameter_grid = config["research"]["parameter_grid"].get(strategy_name, {})
-    candidates = expand_parameter_grid(parameter_grid)
+    # Drop grid points the strategy would reject before any window is scored.
+    candidates = [
+        params
+        for params in expand_parameter_grid(parameter_grid)
+        if _is_valid_candidate(config["strategy"], strategy_name, params)
+    ]
     price_data_by_symbol = _load_price_data_by_symbol(config)
     common_index = _common_index(price_data_by_symbol)
     windows = generate_walk_forward_windows(common_index, research_config)
@@ -231,7 +383,9 @@ def run_walk_forward_from_config(
     if not windows:
         raise ValueError("Not enough overlapping history to run walk-forward analysis")
     if not candidates:
-        raise ValueError(f"No parameter candidates configured for {strategy_name}")
+        raise ValueError(
+            f"No valid parameter candidates configured for {strategy_name}"
+        )
 
     benchmark_symbol = config["data"].get("benchmark")
     benchmark_curve: pd.Series | None = None
@@ -249,72 +403,79 @@ def run_walk_forward_from_config(
             benchmark_data["Close"],
             config["backtest"]["initial_capital"],
         )
-        benchmark_returns = benchmark_curve.pct_change().fillna(0.0)
+        benchmark_returns = _curve_returns(benchmark_curve)
 
     backtest_config = BacktestConfig.from_dict(config["backtest"])
     risk_free_rate = config["risk"].get("risk_free_rate", 0.02)
     window_records: list[dict[str, Any]] = []
     oos_windows: list[pd.DataFrame] = []
-    oos_trades: list[Trade] = []
+    oos_trade_frames: list[pd.DataFrame] = []
 
-    for window in windows:
-        best_params: dict[str, Any] | None = None
-        best_metric = float("-inf")
+    candidate_configs = [
+        _strategy_config_with_params(config["strategy"], strategy_name, params)
+        for params in candidates
+    ]
+    scoring_inputs = {
+        "price_data_by_symbol": price_data_by_symbol,
+        "backtest_config": backtest_config,
+        "risk_free_rate": risk_free_rate,
+        "benchmark_returns": benchmark_returns,
+    }
+
+    workers = _candidate_workers(research_config.n_jobs)
+    with _candidate_executor(research_config.n_jobs, scoring_inputs) as executor:
+        for window in windows:
+            scores = _score_candidates(
+                candidate_configs,
+                executor=executor,
+                workers=workers,
+                inputs=scoring_inputs,
+                start=window.train_start,
+                end=window.train_end,
+                metric=research_config.metric,
+            )
+            best_params: dict[str, Any] | None = None
+            best_metric = float("-inf")
+            for params, score in zip(candidates, scores, strict=True):
+                if score > best_metric:
+                    best_metric = score
+                    best_params = params
+
+            if best_params is None:
+                raise ValueError("Failed to select walk-forward parameters")
 
-        for params in candidates:
-            strategy_config = _strategy_config_with_params(
+            selected_strategy_config = _strategy_config_with_params(
                 config["strategy"],
                 strategy_name,
-                params,
+                best_params,
             )
-            _, train_metrics, _ = _evaluate_window(
+            test_results, test_metrics, test_trades = _evaluate_window(
                 price_data_by_symbol=price_data_by_symbol,
-                strategy_config=strategy_config,
+                strategy_config=selected_strategy_config,
                 backtest_config=backtest_config,
                 risk_free_rate=risk_free_rate,
-                start=window.train_start,
-                end=window.train_end,
+                start=window.test_start,
+                end=window.test_end,
                 benchmark_returns=benchmark_returns,
+                warmup_start=window.train_start,
+            )
+            oos_windows.append(test_results)
+            oos_trade_frames.append(test_trades)
+            window_records.append(
+                {
+                    "train_start": window.train_start.date().isoformat(),
+                    "train_end": window.train_end.date().isoformat(),
+                    "test_start": window.test_start.date().isoformat(),
+                    "test_end": window.test_end.date().isoformat(),
+                    "selected_parameters": dumps(best_params, sort_keys=True),
+                    "train_metric": best_metric,
+                    "test_total_return": test_metrics.get("Total Return", float("nan")),
+                    "test_sharpe_ratio": test_metrics.get("Sharpe Ratio", float("nan")),
+                    "test_max_drawdown": test_metrics.get("Max Drawdown", float("nan")),
+                }
             )
-            score = float(train_metrics.get(research_config.metric, float("-inf")))
-            if score > best_metric:
-                best_metric = score
-                best_params = params
-
-        if best_params is None:
-            raise ValueError("Failed to select walk-forward parameters")
-
-        selected_strategy_config = _strategy_config_with_params(
-            config["strategy"],
-            strategy_name,
-            best_params,
-        )
-        test_results, test_metrics, test_trades = _evaluate_window(
-            price_data_by_symbol=price_data_by_symbol,
-            strategy_config=selected_strategy_config,
-            backtest_config=backtest_config,
-            risk_free_rate=risk_free_rate,
-            start=window.test_start,
-            end=window.test_end,
-            benchmark_returns=benchmark_returns,
-            warmup_start=window.train_start,
-        )
-        oos_windows.append(test_results)
-        oos_trades.extend(test_trades)
-        window_records.append(
-            {
-                "train_start": window.train_start.date().isoformat(),
-                "train_end": window.train_end.date().isoformat(),
-                "test_start": window.test_start.date().isoformat(),
-                "test_end": window.test_end.date().isoformat(),
-                "selected_parameters": dumps(best_params, sort_keys=True),
-                "train_metric": best_metric,
-                "test_total_return": test_metrics.get("Total Return", float("nan")),
-                "test_sharpe_ratio": test_metrics.get("Sharpe Ratio", float("nan")),
-                "test_max_drawdown": test_metrics.get("Max Drawdown", float("nan")),
-            }
-        )
 
+    oos_trades = trades_from_frame(_concat_trade_frames(oos_trade_frames))
     oos_results = _build_oos_results(
         window_results=oos_windows,
         initial_capital=backtest_config.initial_capital,
@@ -325,7 +486,7 @@ def run_walk_forward_from_config(
         else None
     )
     aligned_benchmark_returns = (
-        aligned_benchmark_curve.pct_change().fillna(0.0)
+        _curve_returns(aligned_benchmark_curve)
         if aligned_benchmark_curve is not None
         else None
     )
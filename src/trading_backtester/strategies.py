@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import product
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from ._kernels import mean_reversion_positions
 from .data import REQUIRED_PRICE_COLUMNS
+from .portfolio import simple_returns
+
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - exercised only without bottleneck
+    bn = None
 
 
 def _validate_input_data(data: pd.DataFrame) -> pd.DataFrame:
@@ -21,7 +27,46 @@ def _validate_input_data(data: pd.DataFrame) -> pd.DataFrame:
     return data.sort_index().copy()
 
 
-@dataclass
+def _rolling_mean(close: pd.Series, window: int) -> pd.Series:
+    """Trailing mean that is NaN until a full window is available."""
+    values = close.to_numpy(dtype=float)
+    if window > len(values):
+        # No full window yet; bottleneck would reject the window outright.
+        means = np.full(len(values), np.nan)
+    elif bn is not None:
+        means = bn.move_mean(values, window, min_count=window)
+    elif np.isnan(values).any():
+        return close.rolling(window, min_periods=window).mean()
+    else:
+        # Without bottleneck, difference a running sum: one O(n) pass instead
+        # of pandas' per-window bookkeeping. Gaps would poison the running
+        # sum, so those inputs take the pandas path above.
+        means = np.full(len(values), np.nan)
+        running_sum = np.concatenate(([0.0], np.cumsum(values)))
+        means[window - 1 :] = (running_sum[window:] - running_sum[:-window]) / window
+    if window <= len(values):
+        # Like pandas, report a constant window's value exactly: rounding in
+        # the running sums would otherwise turn equal averages into a
+        # spurious crossover.
+        starts = np.concatenate(([True], values[1:] != values[:-1]))
+        run_start = np.flatnonzero(starts)[np.cumsum(starts) - 1]
+        constant = np.arange(len(values)) - run_start + 1 >= window
+        means[constant] = values[constant]
+    return pd.Series(means, index=close.index)
+
+
+def _crossover_positions(
+    short_values: np.ndarray, long_values: np.ndarray, *, allow_short: bool
+) -> np.ndarray:
+    """Long while the short MA is above the long MA, short (optionally) below."""
+    # NaN warm-up bars compare False on both sides and stay flat.
+    target_position = (short_values > long_values).astype(np.int8)
+    if allow_short:
+        target_position[short_values < long_values] = -1
+    return target_position
+
+
+@dataclass(slots=True)
 class BaseStrategy:
     name: str
 
@@ -29,7 +74,7 @@ class BaseStrategy:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class MovingAverageCrossover(BaseStrategy):
     short_window: int = 20
     long_window: int = 100
@@ -43,7 +88,8 @@ class MovingAverageCrossover(BaseStrategy):
     ) -> None:
         if short_window >= long_window:
             raise ValueError("short_window must be smaller than long_window")
-        super().__init__(name="moving_average_crossover")
+        # slots=True recreates the class, so zero-argument super() is unusable.
+        BaseStrategy.__init__(self, name="moving_average_crossover")
         self.short_window = short_window
         self.long_window = long_window
         self.allow_short = allow_short
@@ -51,23 +97,23 @@ class MovingAverageCrossover(BaseStrategy):
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         frame = _validate_input_data(data)
         close = frame["Close"]
-        short_ma = close.rolling(
-            self.short_window, min_periods=self.short_window
-        ).mean()
-        long_ma = close.rolling(self.long_window, min_periods=self.long_window).mean()
-
-        target_position = pd.Series(0.0, index=frame.index)
-        target_position = target_position.mask(short_ma > long_ma, 1.0)
-        if self.allow_short:
-            target_position = target_position.mask(short_ma < long_ma, -1.0)
-
-        signals = pd.DataFrame(index=frame.index)
-        signals["close"] = close
-        signals["short_ma"] = short_ma
-        signals["long_ma"] = long_ma
-        signals["signal"] = target_position.diff().fillna(target_position)
-        signals["target_position"] = target_position.fillna(0.0)
-        return signals
+        short_ma = _rolling_mean(close, self.short_window)
+        long_ma = _rolling_mean(close, self.long_window)
+
+        target_position = _crossover_positions(
+            short_ma.to_numpy(), long_ma.to_numpy(), allow_short=self.allow_short
+        )
+
+        return pd.DataFrame(
+            {
+                "close": close,
+                "short_ma": short_ma,
+                "long_ma": long_ma,
+                "signal": np.diff(target_position, prepend=np.int8(0)),
+                "target_position": target_position,
+            },
+            index=frame.index,
+        )
 
     @staticmethod
     def optimize_parameters(
@@ -78,32 +124,59 @@ class MovingAverageCrossover(BaseStrategy):
     ) -> dict[str, float]:
         frame = _validate_input_data(data)
         close = frame["Close"]
-        returns = close.pct_change().fillna(0.0)
+        returns = simple_returns(close.to_numpy(dtype=float))
+        returns[np.isnan(returns)] = 0.0
         best: dict[str, float] | None = None
 
-        for short_window, long_window in product(short_windows, long_windows):
-            if short_window >= long_window:
+        # Each window appears in many pairs; compute its average only once.
+        moving_averages = {
+            window: _rolling_mean(close, window).to_numpy()
+            for window in sorted({*short_windows, *long_windows})
+        }
+        for short_window in short_windows:
+            # Score every valid long window for this short window at once: one
+            # broadcast comparison yields a (pairs, bars) position matrix with
+            # the same positions generate_signals would produce.
+            rows = [
+                row
+                for row, long_window in enumerate(long_windows)
+                if short_window < long_window
+            ]
+            if not rows:
                 continue
-            strategy = MovingAverageCrossover(
-                short_window=short_window, long_window=long_window
+            target_position = _crossover_positions(
+                moving_averages[short_window][np.newaxis, :],
+                np.stack([moving_averages[long_windows[row]] for row in rows]),
+                allow_short=True,
             )
-            signals = strategy.generate_signals(frame)
-            shifted_position = signals["target_position"].shift(1).fillna(0.0)
+            # Keep the lagged positions int8 so the only full-width matrix is
+            # the strategy returns; prices stay float64 so the crossovers
+            # match generate_signals exactly.
+            shifted_position = np.zeros(target_position.shape, dtype=np.int8)
+            shifted_position[:, 1:] = target_position[:, :-1]
             strategy_returns = shifted_position * returns
-            volatility = strategy_returns.std(ddof=0)
-            sharpe = (
-                np.sqrt(252) * strategy_returns.mean() / volatility
-                if volatility > 0
-                else float("-inf")
-            )
-            result = {
-                "best_short_window": float(short_window),
-                "best_long_window": float(long_window),
-                "best_sharpe_ratio": float(sharpe),
-                "best_total_return": float((1 + strategy_returns).prod() - 1),
-            }
-            if best is None or result["best_sharpe_ratio"] > best["best_sharpe_ratio"]:
-                best = result
+            volatilities = strategy_returns.std(axis=1)
+            means = strategy_returns.mean(axis=1)
+            total_returns = np.prod(1.0 + strategy_returns, axis=1) - 1.0
+
+            for position, row in enumerate(rows):
+                volatility = volatilities[position]
+                sharpe = (
+                    np.sqrt(252) * means[position] / volatility
+                    if volatility > 0
+                    else float("-inf")
+                )
+                result = {
+                    "best_short_window": float(short_window),
+                    "best_long_window": float(long_windows[row]),
+                    "best_sharpe_ratio": float(sharpe),
+                    "best_total_return": float(total_returns[position]),
+                }
+                if (
+                    best is None
+                    or result["best_sharpe_ratio"] > best["best_sharpe_ratio"]
+                ):
+                    best = result
 
         if best is None:
             raise ValueError("No valid parameter combinations were evaluated")
@@ -112,7 +185,7 @@ class MovingAverageCrossover(BaseStrategy):
         return best
 
 
-@dataclass
+@dataclass(slots=True)
 class MeanReversionStrategy(BaseStrategy):
     lookback: int = 20
     entry_zscore: float = 1.5
@@ -132,7 +205,7 @@ class MeanReversionStrategy(BaseStrategy):
     ) -> None:
         if exit_zscore >= entry_zscore:
             raise ValueError("exit_zscore must be smaller than entry_zscore")
-        super().__init__(name="mean_reversion")
+        BaseStrategy.__init__(self, name="mean_reversion")
         self.lookback = lookback
         self.entry_zscore = entry_zscore
         self.exit_zscore = exit_zscore
@@ -143,7 +216,7 @@ class MeanReversionStrategy(BaseStrategy):
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         frame = _validate_input_data(data)
         close = frame["Close"]
-        rolling_mean = close.rolling(self.lookback, min_periods=self.lookback).mean()
+        rolling_mean = _rolling_mean(close, self.lookback)
         rolling_std = close.rolling(self.lookback, min_periods=self.lookback).std(
             ddof=0
         )
@@ -160,41 +233,37 @@ class MeanReversionStrategy(BaseStrategy):
         # avoids false signals from thin-volume price spikes
         liquid = avg_dollar_volume >= self.min_avg_dollar_volume
 
-        # State machine: iterate bar-by-bar so entry/exit logic is explicit and
-        # easy to audit. Vectorized version would be faster but harder to verify.
-        positions: list[float] = []
-        current_position = 0.0
-        for is_liquid, current_zscore in zip(
-            liquid.fillna(False), zscore.fillna(0.0), strict=False
-        ):
-            if not is_liquid:
-                current_position = 0.0
-            elif current_position == 0.0:
-                if current_zscore <= -self.entry_zscore:
-                    current_position = 1.0
-                elif self.allow_short and current_zscore >= self.entry_zscore:
-                    current_position = -1.0
-            elif current_position > 0.0 and current_zscore >= -self.exit_zscore:
-                current_position = 0.0
-            elif current_position < 0.0 and current_zscore <= self.exit_zscore:
-                current_position = 0.0
-            positions.append(current_position)
-
-        target_position = pd.Series(positions, index=frame.index, dtype=float)
-        signals = pd.DataFrame(index=frame.index)
-        signals["close"] = close
-        signals["zscore"] = zscore
-        signals["avg_dollar_volume"] = avg_dollar_volume
-        signals["is_liquid"] = liquid.fillna(False)
-        signals["signal"] = target_position.diff().fillna(target_position)
-        signals["target_position"] = target_position.fillna(0.0)
-        return signals
+        # State machine: entry/exit logic stays an explicit bar-by-bar loop so it
+        # is easy to audit; the loop itself is compiled in _kernels.
+        liquid_flags = liquid.fillna(False).to_numpy(dtype=bool)
+        target_position = mean_reversion_positions(
+            liquid_flags,
+            zscore.fillna(0.0).to_numpy(dtype=float),
+            float(self.entry_zscore),
+            float(self.exit_zscore),
+            bool(self.allow_short),
+        )
+        return pd.DataFrame(
+            {
+                "close": close,
+                "zscore": zscore,
+                "avg_dollar_volume": avg_dollar_volume,
+                "is_liquid": liquid_flags,
+                "signal": np.diff(target_position, prepend=np.int8(0)),
+                "target_position": target_position,
+            },
+            index=frame.index,
+        )
+
+
+STRATEGY_TYPES: dict[str, type[BaseStrategy]] = {
+    "moving_average": MovingAverageCrossover,
+    "mean_reversion": MeanReversionStrategy,
+}
 
 
 def build_strategy(config: dict[str, Any]) -> BaseStrategy:
     strategy_name = config.get("name", "mean_reversion")
-    if strategy_name == "moving_average":
-        return MovingAverageCrossover(**config.get("moving_average", {}))
-    if strategy_name == "mean_reversion":
-        return MeanReversionStrategy(**config.get("mean_reversion", {}))
-    raise ValueError(f"Unknown strategy: {strategy_name}")
+    if strategy_name not in STRATEGY_TYPES:
+        raise ValueError(f"Unknown strategy: {strategy_name}")
+    return STRATEGY_TYPES[strategy_name](**config.get(strategy_name, {}))
@@ -1,7 +1,7 @@
 import math
 
 import pandas as pd
-from trading_backtester.backtest import BacktestConfig, BacktestEngine
+from trading_backtester.backtest import BacktestConfig, BacktestEngine, trades_to_frame
 
 
 def _price_frame(values: list[float]) -> pd.DataFrame:
@@ -71,3 +71,87 @@ def test_backtest_applies_transaction_costs_on_entry_and_exit() -> None:
     assert len(trades) == 1
     assert math.isclose(trades[0].net_pnl, 9498.0, rel_tol=1e-9)
     assert math.isclose(results["Portfolio_Value"].iloc[-1], 109498.0, rel_tol=1e-9)
+
+
+def test_backtest_holds_cash_flat_between_signals() -> None:
+    data = _price_frame([100.0, 101.0, 102.0, 100.0, 110.0, 111.0, 112.0])
+    signals = pd.DataFrame(
+        {"target_position": [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]},
+        index=data.index,
+    )
+
+    engine = BacktestEngine(
+        BacktestConfig(
+            initial_capital=100000.0,
+            position_size=0.95,
+            commission_bps=0.0,
+            fixed_commission=0.0,
+            spread_bps=0.0,
+            slippage_bps=0.0,
+            stop_loss=None,
+            take_profit=None,
+            trailing_stop=None,
+        )
+    )
+    results, trades = engine.run(data, signals, symbol="TEST")
+
+    assert len(trades) == 1
+    assert results["Portfolio_Value"].iloc[:5].tolist() == [100000.0] * 5
+    assert results["Returns"].iloc[:4].tolist() == [0.0] * 4
+    expected_value = 100000.0 + 95000.0 * (111.0 / 110.0 - 1.0)
+    assert math.isclose(trades[0].gross_pnl, expected_value - 100000.0, rel_tol=1e-9)
+    assert math.isclose(results["Portfolio_Value"].iloc[-1], expected_value)
+    assert results["Portfolio_Value"].iloc[-2] == results["Portfolio_Value"].iloc[-1]
+    assert results["Returns"].iloc[-1] == 0.0
+
+
+def test_backtest_exits_long_at_stop_loss_level() -> None:
+    data = _price_frame([100.0, 100.0, 100.0, 100.0])
+    data.loc[data.index[2], "Low"] = 90.0
+    signals = pd.DataFrame(
+        {"target_position": [1.0, 1.0, 1.0, 1.0]},
+        index=data.index,
+    )
+
+    engine = BacktestEngine(
+        BacktestConfig(
+            initial_capital=100000.0,
+            position_size=0.95,
+            commission_bps=0.0,
+            fixed_commission=0.0,
+            spread_bps=0.0,
+            slippage_bps=0.0,
+            stop_loss=0.05,
+            take_profit=None,
+            trailing_stop=0.2,
+        )
+    )
+    results, trades = engine.run(data, signals, symbol="TEST")
+
+    assert trades[0].exit_reason == "stop_loss"
+    assert trades[0].exit_date == data.index[2]
+    assert math.isclose(trades[0].exit_price, 95.0, rel_tol=1e-9)
+    assert math.isclose(results["Portfolio_Value"].iloc[2], 95250.0, rel_tol=1e-9)
+
+
+def test_backtest_trade_frame_matches_trade_objects() -> None:
+    data = _price_frame([100.0, 100.0, 110.0, 105.0, 100.0, 100.0])
+    signals = pd.DataFrame(
+        {"target_position": [1.0, 1.0, -1.0, -1.0, 0.0, 0.0]},
+        index=data.index,
+    )
+
+    engine = BacktestEngine(BacktestConfig(stop_loss=None, take_profit=None))
+    _, trades = engine.run(data, signals, symbol="TEST")
+
+    assert [trade.side for trade in trades] == ["long", "short"]
+    assert engine.trade_frame["side"].tolist() == ["long", "short"]
+    assert engine.trade_frame["net_pnl"].tolist() == [t.net_pnl for t in trades]
+    assert engine.trade_frame["exit_date"].tolist() == [t.exit_date for t in trades]
+    assert trades_to_frame(trades)["exit_date"].tolist() == [
+        data.index[3].isoformat(),
+        data.index[5].isoformat(),
+    ]
+    assert trades_to_frame(trades).to_dict("records") == [
+        trade.to_record() for trade in trades
+    ]
@@ -0,0 +1,137 @@
+import io
+
+import pandas as pd
+import pytest
+import trading_backtester.data as data_module
+from trading_backtester.data import (
+    fetch_price_data,
+    load_price_data,
+    read_timeseries_csv,
+)
+
+
+def test_load_price_data_parses_only_price_columns(tmp_path) -> None:
+    index = pd.date_range("2024-01-01", periods=3, freq="D", name="Date")
+    frame = pd.DataFrame(
+        {
+            "Open": [1.0, 2.0, 3.0],
+            "High": [1.5, 2.5, 3.5],
+            "Low": [0.5, 1.5, 2.5],
+            "Close": [1.2, 2.2, 3.2],
+            "Adj Close": [1.1, 2.1, 3.1],
+            "Volume": [100, 200, 300],
+        },
+        index=index,
+    )
+    path = tmp_path / "prices.csv"
+    frame.to_csv(path)
+
+    loaded = load_price_data(path)
+
+    assert list(loaded.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert isinstance(loaded.index, pd.DatetimeIndex)
+    assert loaded.index.equals(index)
+    assert read_timeseries_csv(path).columns.tolist() == list(frame.columns)
+
+
+def test_load_price_data_accepts_compressed_bom_and_buffer_inputs(tmp_path) -> None:
+    text = (
+        "Date,Open,High,Low,Close,Adj Close,Volume\n"
+        "2024-01-01,1.0,1.5,0.5,1.2,1.1,100\n"
+        "2024-01-02,2.0,2.5,1.5,2.2,2.1,200\n"
+    )
+    gzipped = tmp_path / "prices.csv.gz"
+    pd.read_csv(io.StringIO(text)).to_csv(gzipped, index=False)
+    with_bom = tmp_path / "prices_bom.csv"
+    with_bom.write_text(text, encoding="utf-8-sig")
+    expected = pd.read_csv(io.StringIO(text), index_col=0, parse_dates=True)[
+        ["Open", "High", "Low", "Close", "Volume"]
+    ]
+
+    for source in (gzipped, with_bom, str(with_bom), io.StringIO(text)):
+        loaded = load_price_data(source)
+        pd.testing.assert_frame_equal(loaded, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+@pytest.mark.parametrize(
+    ("start", "periods"),
+    [("2024-01-02 09:30", 5), ("2024-03-08 09:30", 400)],
+    ids=["fixed-offset", "dst-change"],
+)
+def test_load_price_data_returns_offset_timestamps_in_utc(
+    tmp_path, monkeypatch, engine, start, periods
+) -> None:
+    if engine == "pyarrow" and not data_module._HAS_PYARROW:
+        pytest.skip("pyarrow is not installed")
+    monkeypatch.setattr(data_module, "_CSV_ENGINE", engine)
+    index = pd.date_range(
+        start, periods=periods, freq="h", tz="America/New_York", name="Datetime"
+    )
+    frame = pd.DataFrame(
+        {
+            "Open": 1.0,
+            "High": 1.5,
+            "Low": 0.5,
+            "Close": 1.2,
+            "Volume": 100,
+        },
+        index=index,
+    )
+    path = tmp_path / "X_1h.csv"
+    frame.to_csv(path)
+
+    loaded = load_price_data(path)
+
+    assert str(loaded.index.dtype) == "datetime64[ns, UTC]"
+    assert loaded.index.name == "Datetime"
+    assert loaded.index.equals(index.tz_convert("UTC"))
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_read_timeseries_csv_keeps_naive_timestamps_naive(
+    tmp_path, monkeypatch, engine
+) -> None:
+    if engine == "pyarrow" and not data_module._HAS_PYARROW:
+        pytest.skip("pyarrow is not installed")
+    monkeypatch.setattr(data_module, "_CSV_ENGINE", engine)
+    index = pd.date_range("2024-01-01", periods=3, freq="D", name="Date")
+    path = tmp_path / "signals.csv"
+    pd.DataFrame({"target_position": [0, 1, 0]}, index=index).to_csv(path)
+
+    loaded = read_timeseries_csv(path)
+
+    assert str(loaded.index.dtype) == "datetime64[ns]"
+    assert loaded.index.equals(index)
+
+
+def test_fetch_price_data_reuses_cache_without_downloading(
+    tmp_path, monkeypatch
+) -> None:
+    index = pd.date_range("2024-01-01", periods=3, freq="D", name="Date")
+    frame = pd.DataFrame(
+        {
+            "Open": [1.0, 2.0, 3.0],
+            "High": [1.5, 2.5, 3.5],
+            "Low": [0.5, 1.5, 2.5],
+            "Close": [1.2, 2.2, 3.2],
+            "Volume": [100, 200, 300],
+        },
+        index=index,
+    )
+    frame.to_csv(tmp_path / "OLD_1d.csv")
+    downloads: list[str] = []
+
+    def fake_download(symbol: str, **kwargs) -> pd.DataFrame:
+        downloads.append(symbol)
+        return frame
+
+    monkeypatch.setattr(data_module.yf, "download", fake_download)
+
+    legacy = fetch_price_data("OLD", None, None, cache_dir=tmp_path)
+    first = fetch_price_data("NEW", None, None, cache_dir=tmp_path)
+    second = fetch_price_data("NEW", None, None, cache_dir=tmp_path)
+
+    assert downloads == ["NEW"]
+    pd.testing.assert_frame_equal(legacy, frame, check_freq=False)
+    pd.testing.assert_frame_equal(second, first, check_freq=False)
@@ -1,8 +1,19 @@
 import math
+from dataclasses import FrozenInstanceError
 
 import numpy as np
 import pandas as pd
-from trading_backtester.metrics import PerformanceMetrics, calculate_metrics
+import pytest
+from trading_backtester.backtest import (
+    BacktestConfig,
+    BacktestEngine,
+    trades_from_frame,
+)
+from trading_backtester.metrics import (
+    BENCHMARK_METRIC_NAMES,
+    PerformanceMetrics,
+    calculate_metrics,
+)
 
 
 def test_performance_metrics_calculate_drawdown_and_sharpe() -> None:
@@ -15,6 +26,17 @@ def test_performance_metrics_calculate_drawdown_and_sharpe() -> None:
     assert math.isclose(metrics.sharpe_ratio(), expected_sharpe, rel_tol=1e-9)
 
 
+def test_performance_metrics_inputs_cannot_go_stale() -> None:
+    metrics = PerformanceMetrics(returns=pd.Series([0.10, -0.20, 0.05]))
+    sharpe = metrics.sharpe_ratio()
+
+    with pytest.raises(FrozenInstanceError):
+        metrics.risk_free_rate = 0.0  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        metrics.returns = pd.Series([0.5])  # type: ignore[misc]
+    assert metrics.sharpe_ratio() == sharpe
+
+
 def test_calculate_metrics_uses_results_frame() -> None:
     results = pd.DataFrame(
         {
@@ -52,3 +74,56 @@ def test_calculate_metrics_includes_benchmark_comparison_stats() -> None:
     assert "Information Ratio" in metrics
     assert "Beta" in metrics
     assert math.isfinite(metrics["Benchmark Return"])
+
+
+def test_benchmark_metric_names_match_the_benchmark_report() -> None:
+    returns = pd.Series([0.0, 0.01, -0.005, 0.015])
+    benchmark_returns = pd.Series([0.0, 0.008, -0.002, 0.01])
+
+    with_benchmark = calculate_metrics(returns, benchmark_returns=benchmark_returns)
+    without_benchmark = calculate_metrics(returns)
+
+    assert set(with_benchmark) - set(without_benchmark) == BENCHMARK_METRIC_NAMES
+
+
+def test_total_return_compounds_and_handles_full_loss() -> None:
+    returns = pd.Series([0.10, -0.05, 0.02])
+    wiped_out = pd.Series([0.10, -1.0, 0.05])
+
+    expected = (1.10 * 0.95 * 1.02) - 1.0
+
+    assert math.isclose(
+        PerformanceMetrics(returns=returns).total_return(), expected, rel_tol=1e-12
+    )
+    assert PerformanceMetrics(returns=wiped_out).total_return() == -1.0
+
+
+def test_value_at_risk_and_expected_shortfall_read_the_tail() -> None:
+    returns = pd.Series(np.linspace(-0.05, 0.05, 101))
+    metrics = PerformanceMetrics(returns=returns, risk_free_rate=0.0)
+
+    var = metrics.value_at_risk(0.95)
+
+    assert math.isclose(var, -0.045, rel_tol=1e-9)
+    assert math.isclose(
+        metrics.expected_shortfall(0.95), returns[returns <= var].mean(), rel_tol=1e-9
+    )
+
+
+def test_trade_metrics_accept_a_trade_frame() -> None:
+    index = pd.date_range("2024-01-01", periods=8, freq="D")
+    close = pd.Series([100.0, 100.0, 110.0, 105.0, 100.0, 100.0, 95.0, 96.0])
+    data = pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1e6}
+    ).set_index(index)
+    signals = pd.DataFrame({"target_position": [1, 1, -1, -1, 0, 1, 1, 0]}, index=index)
+    engine = BacktestEngine(BacktestConfig(stop_loss=None, take_profit=None))
+
+    results, trade_frame = engine.simulate(data, signals)
+
+    from_frame = calculate_metrics(results, trade_frame, risk_free_rate=0.0)
+    from_objects = calculate_metrics(
+        results, trades_from_frame(trade_frame), risk_free_rate=0.0
+    )
+    assert from_frame["Total Trades"] == 3.0
+    assert pd.Series(from_frame).equals(pd.Series(from_objects))
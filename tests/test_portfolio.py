@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+from trading_backtester.portfolio import buy_and_hold_curve, simple_returns
+
+
+def test_simple_returns_matches_pct_change() -> None:
+    close = pd.Series([100.0, 101.5, 99.0, 99.0, 120.25])
+
+    returns = simple_returns(close.to_numpy())
+
+    assert np.isnan(returns[0])
+    np.testing.assert_array_equal(returns[1:], close.pct_change().to_numpy()[1:])
+
+
+def test_buy_and_hold_curve_compounds_from_initial_capital() -> None:
+    index = pd.date_range("2024-01-01", periods=3, freq="D")
+    close = pd.Series([50.0, 55.0, 44.0], index=index, name="Close")
+
+    curve = buy_and_hold_curve(close, 1000.0)
+
+    assert curve.index.equals(index)
+    np.testing.assert_allclose(curve.to_numpy(), [1000.0, 1100.0, 880.0])
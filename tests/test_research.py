@@ -1,8 +1,20 @@
+from concurrent.futures import Executor
+
+import numpy as np
 import pandas as pd
+import pytest
+from trading_backtester.backtest import BacktestConfig
+from trading_backtester.config import DEFAULT_CONFIG
 from trading_backtester.research import (
     WalkForwardConfig,
+    _candidate_executor,
+    _is_valid_candidate,
+    _score_candidate,
+    _score_candidates,
+    _strategy_config_with_params,
     expand_parameter_grid,
     generate_walk_forward_windows,
+    run_walk_forward_from_config,
 )
 
 
@@ -33,3 +45,129 @@ def test_generate_walk_forward_windows_uses_rolling_train_and_test_slices() -> N
     assert windows[0].test_end == pd.Timestamp("2024-01-06")
     assert windows[-1].test_start == pd.Timestamp("2024-01-11")
     assert windows[-1].test_end == pd.Timestamp("2024-01-12")
+
+
+def _price_frame(periods: int = 120, seed: int = 7) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=periods, freq="B")
+    close = pd.Series(
+        100.0 * np.exp(np.cumsum(np.random.default_rng(seed).normal(0, 0.02, periods))),
+        index=index,
+    )
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": 1_000_000,
+        },
+        index=index,
+    )
+
+
+def test_score_candidates_matches_serial_when_run_in_worker_processes() -> None:
+    data = _price_frame()
+    index = data.index
+    strategy_configs = [
+        _strategy_config_with_params(
+            DEFAULT_CONFIG["strategy"],
+            "mean_reversion",
+            {"lookback": lookback, "min_avg_dollar_volume": 0},
+        )
+        for lookback in (5, 10, 20)
+    ]
+    inputs = {
+        "price_data_by_symbol": {"TEST": data},
+        "backtest_config": BacktestConfig(),
+        "risk_free_rate": 0.0,
+        "benchmark_returns": None,
+    }
+    window = {"start": index[0], "end": index[-1], "metric": "Total Return"}
+
+    serial = _score_candidates(strategy_configs, executor=None, inputs=inputs, **window)
+    with _candidate_executor(2, inputs) as executor:
+        assert executor is not None
+        parallel = _score_candidates(
+            strategy_configs, executor=executor, workers=2, inputs=inputs, **window
+        )
+
+    assert parallel == serial
+    assert len(set(serial)) > 1
+
+
+def test_is_valid_candidate_rejects_parameters_the_strategy_refuses() -> None:
+    strategy_config = DEFAULT_CONFIG["strategy"]
+
+    assert _is_valid_candidate(
+        strategy_config, "mean_reversion", {"entry_zscore": 2.0, "exit_zscore": 0.5}
+    )
+    assert not _is_valid_candidate(
+        strategy_config, "mean_reversion", {"entry_zscore": 0.5, "exit_zscore": 0.5}
+    )
+    ma_config = {**strategy_config, "name": "moving_average"}
+    assert not _is_valid_candidate(
+        ma_config, "moving_average", {"short_window": 60, "long_window": 50}
+    )
+
+
+def test_score_candidate_uses_benchmark_only_for_benchmark_metrics() -> None:
+    data = _price_frame()
+    benchmark_returns = _price_frame(seed=11)["Close"].pct_change().fillna(0.0)
+    strategy_config = _strategy_config_with_params(
+        DEFAULT_CONFIG["strategy"], "mean_reversion", {"min_avg_dollar_volume": 0}
+    )
+    kwargs = {
+        "price_data_by_symbol": {"TEST": data},
+        "backtest_config": BacktestConfig(),
+        "risk_free_rate": 0.0,
+        "start": data.index[0],
+        "end": data.index[-1],
+    }
+
+    sharpe_with = _score_candidate(
+        strategy_config,
+        benchmark_returns=benchmark_returns,
+        metric="Sharpe Ratio",
+        **kwargs,
+    )
+    sharpe_without = _score_candidate(
+        strategy_config, benchmark_returns=None, metric="Sharpe Ratio", **kwargs
+    )
+    excess = _score_candidate(
+        strategy_config,
+        benchmark_returns=benchmark_returns,
+        metric="Excess Return",
+        **kwargs,
+    )
+
+    assert sharpe_with == sharpe_without
+    assert np.isfinite(excess)
+
+
+def test_walk_forward_reports_unknown_strategy_names() -> None:
+    config = {
+        **DEFAULT_CONFIG,
+        "strategy": {**DEFAULT_CONFIG["strategy"], "name": "moving_averge"},
+    }
+
+    with pytest.raises(ValueError, match="Unknown strategy: moving_averge"):
+        run_walk_forward_from_config(config)
+
+
+def test_score_candidates_batches_by_pool_size() -> None:
+    class RecordingExecutor(Executor):
+        def __init__(self) -> None:
+            self.chunksizes: list[int] = []
+
+        def map(self, fn, *iterables, timeout=None, chunksize=1):
+            self.chunksizes.append(chunksize)
+            return iter([0.0] * len(iterables[0]))
+
+    executor = RecordingExecutor()
+    window = {"start": None, "end": None, "metric": "Sharpe Ratio"}
+    configs = [{}] * 40
+
+    _score_candidates(configs, executor=executor, workers=2, inputs={}, **window)
+    _score_candidates(configs, executor=executor, workers=16, inputs={}, **window)
+
+    assert executor.chunksizes == [5, 1]
@@ -1,4 +1,7 @@
+import numpy as np
 import pandas as pd
+import pytest
+import trading_backtester.strategies as strategies
 from trading_backtester.strategies import MeanReversionStrategy, MovingAverageCrossover
 
 
@@ -40,3 +43,105 @@ def test_mean_reversion_enters_on_oversold_and_exits_on_reversion() -> None:
     signals = strategy.generate_signals(data)
 
     assert signals["target_position"].tolist() == [0.0, 0.0, 0.0, 1.0, 0.0, 0.0]
+
+
+def test_strategies_are_slotted_and_keep_validation() -> None:
+    strategy = MovingAverageCrossover(short_window=5, long_window=10)
+
+    assert not hasattr(strategy, "__dict__")
+    assert strategy.name == "moving_average_crossover"
+    assert strategy == MovingAverageCrossover(short_window=5, long_window=10)
+    assert MeanReversionStrategy().name == "mean_reversion"
+    with pytest.raises(ValueError, match="short_window"):
+        MovingAverageCrossover(short_window=10, long_window=5)
+
+
+def test_strategies_store_positions_as_int8() -> None:
+    data = _price_frame([1.0, 1.0, 1.0, 2.0, 3.0, 1.0, 0.5])
+
+    for strategy in (
+        MovingAverageCrossover(short_window=2, long_window=3),
+        MeanReversionStrategy(lookback=3, min_avg_dollar_volume=0.0),
+    ):
+        signals = strategy.generate_signals(data)
+
+        assert signals["target_position"].dtype == "int8"
+        assert signals["signal"].dtype == "int8"
+        assert signals["signal"].cumsum().tolist() == (
+            signals["target_position"].tolist()
+        )
+
+
+def test_rolling_mean_without_bottleneck_matches_pandas(monkeypatch) -> None:
+    close = pd.Series(np.linspace(50.0, 150.0, 300) + np.sin(np.arange(300)))
+    monkeypatch.setattr(strategies, "bn", None)
+
+    result = strategies._rolling_mean(close, 30)
+
+    expected = close.rolling(30, min_periods=30).mean()
+    assert result.isna().sum() == 29
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+    np.testing.assert_allclose(
+        strategies._rolling_mean(close.iloc[:10], 30).to_numpy(), np.full(10, np.nan)
+    )
+
+
+def test_windows_longer_than_data_yield_no_signal() -> None:
+    # Runs on whichever rolling-mean backend is installed, bottleneck included.
+    data = _price_frame(np.linspace(100.0, 120.0, 50).tolist())
+
+    assert strategies._rolling_mean(data["Close"], 100).isna().all()
+    signals = MovingAverageCrossover(20, 100).generate_signals(data)
+    assert (signals["target_position"] == 0).all()
+    best = MovingAverageCrossover.optimize_parameters(data)
+    assert best["best_long_window"] < 50
+
+
+@pytest.mark.parametrize("use_bottleneck", [True, False])
+def test_flat_prices_do_not_trigger_a_crossover(monkeypatch, use_bottleneck) -> None:
+    if not use_bottleneck:
+        monkeypatch.setattr(strategies, "bn", None)
+    rng = np.random.default_rng(5)
+    trend = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 300)))
+    data = _price_frame([*trend, *np.full(200, 101.37)])
+
+    signals = MovingAverageCrossover(20, 100).generate_signals(data)
+
+    # The last 80 bars have both averages over constant windows.
+    assert (signals["target_position"].iloc[-80:] == 0).all()
+    flat = data["Close"].iloc[-100:]
+    assert (strategies._rolling_mean(flat, 20).dropna() == 101.37).all()
+
+
+def test_mean_reversion_lookback_longer_than_data_stays_flat() -> None:
+    data = _price_frame([100.0, 101.0, 99.0, 100.0])
+
+    signals = MeanReversionStrategy(
+        lookback=10, min_avg_dollar_volume=0.0
+    ).generate_signals(data)
+
+    assert (signals["target_position"] == 0).all()
+
+
+def test_optimize_parameters_scores_match_generated_signals() -> None:
+    rng = np.random.default_rng(3)
+    data = _price_frame((100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 400)))).tolist())
+
+    best = MovingAverageCrossover.optimize_parameters(
+        data, short_windows=range(5, 21, 5), long_windows=range(30, 61, 10)
+    )
+
+    strategy = MovingAverageCrossover(
+        short_window=int(best["best_short_window"]),
+        long_window=int(best["best_long_window"]),
+    )
+    position = strategy.generate_signals(data)["target_position"]
+    strategy_returns = position.shift(1).fillna(0.0) * data["Close"].pct_change()
+    strategy_returns = strategy_returns.fillna(0.0)
+    expected_sharpe = (
+        np.sqrt(252) * strategy_returns.mean() / strategy_returns.std(ddof=0)
+    )
+    assert np.isclose(best["best_sharpe_ratio"], expected_sharpe, rtol=1e-9)
+    assert np.isclose(
+        best["best_total_return"], (1 + strategy_returns).prod() - 1, rtol=1e-9
+    )
@@ -0,0 +1,98 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from trading_backtester.visualize import (  # noqa: E402
+    _portfolio_arrays,
+    plot_drawdown,
+    plot_drawdown_curve,
+    plot_equity_curve,
+    plot_portfolio_value,
+    plot_returns_distribution,
+    plot_trade_pnl,
+)
+
+
+def test_returns_distribution_draws_density_histogram_and_normal_fit() -> None:
+    index = pd.date_range("2024-01-01", periods=500, freq="B")
+    returns = np.random.default_rng(3).normal(0.0, 0.01, len(index))
+    returns[0] = np.nan
+    results = pd.DataFrame({"Returns": returns}, index=index)
+
+    figure = plot_returns_distribution(results)
+    axis = figure.axes[0]
+
+    bars = axis.patches
+    area = sum(bar.get_height() * bar.get_width() for bar in bars)
+    assert len(bars) == 40
+    assert np.isclose(area, 1.0)
+    assert [line.get_label() for line in axis.get_lines()] == ["Normal fit"]
+    plt.close(figure)
+
+
+def test_drawdown_plots_distance_from_running_peak() -> None:
+    index = pd.date_range("2024-01-01", periods=5, freq="B")
+    results = pd.DataFrame(
+        {"Portfolio_Value": [100.0, 110.0, 99.0, 120.0, 90.0]}, index=index
+    )
+
+    figure = plot_drawdown(results)
+    (line,) = figure.axes[0].get_lines()
+
+    assert np.allclose(line.get_ydata(), [0.0, 0.0, -0.1, 0.0, -0.25])
+    plt.close(figure)
+
+
+def test_trade_pnl_draws_one_bar_per_trade() -> None:
+    trades = pd.DataFrame(
+        {
+            "entry_date": ["2024-01-02T00:00:00", "2024-01-02T00:00:00", "2024-01-05"],
+            "net_pnl": [10.0, -5.0, 2.5],
+        }
+    )
+
+    figure = plot_trade_pnl(trades)
+    axis = figure.axes[0]
+
+    assert [bar.get_height() for bar in axis.patches] == [10.0, -5.0, 2.5]
+    assert [label.get_text() for label in axis.get_xticklabels()] == list(
+        trades["entry_date"]
+    )
+    plt.close(figure)
+
+
+def test_array_plot_helpers_match_dataframe_wrappers() -> None:
+    index = pd.date_range("2024-01-01", periods=5, freq="B")
+    values = np.array([100.0, 110.0, 99.0, 120.0, 90.0])
+    results = pd.DataFrame({"Portfolio_Value": values}, index=index)
+
+    for from_frame, from_arrays in (
+        (plot_portfolio_value(results), plot_equity_curve(index.to_numpy(), values)),
+        (plot_drawdown(results), plot_drawdown_curve(index.to_numpy(), values)),
+    ):
+        (frame_line,) = from_frame.axes[0].get_lines()
+        (array_line,) = from_arrays.axes[0].get_lines()
+        assert np.array_equal(frame_line.get_xdata(), array_line.get_xdata())
+        assert np.array_equal(frame_line.get_ydata(), array_line.get_ydata())
+        plt.close(from_frame)
+        plt.close(from_arrays)
+
+
+def test_tz_aware_results_plot_as_datetime64() -> None:
+    index = pd.date_range(
+        "2024-03-08 09:30", periods=400, freq="h", tz="America/New_York"
+    )
+    results = pd.DataFrame(
+        {"Portfolio_Value": np.linspace(100.0, 110.0, 400)}, index=index
+    )
+
+    dates, values = _portfolio_arrays(results)
+    figure = plot_drawdown(results)
+
+    assert dates.dtype == "datetime64[ns]"
+    assert dates[0] == np.datetime64("2024-03-08T14:30")
+    assert values.dtype == np.float64
+    plt.close(figure)
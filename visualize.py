@@ -5,6 +5,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
 
 from trading_backtester.visualize import (
     plot_drawdown,
+    plot_drawdown_curve,
+    plot_equity_curve,
     plot_portfolio_value,
     plot_returns_distribution,
     plot_trade_pnl,
@@ -14,6 +16,8 @@ from trading_backtester.visualize import (
 
 __all__ = [
     "plot_drawdown",
+    "plot_drawdown_curve",
+    "plot_equity_curve",
     "plot_portfolio_value",
     "plot_returns_distribution",
     "plot_trade_pnl",